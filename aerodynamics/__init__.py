@@ -5,16 +5,42 @@ Simulates lift, drag, thrust, and weight with configurable parameters.
 """
 
 from .aircraft_params import AircraftParams
-from .atmosphere import air_density
-from .forces import compute_lift, compute_drag, compute_thrust_required
-from .simulation import SimulationState, AerodynamicsSimulator
+from .atmosphere import air_density, air_density_vec
+from .forces import (
+    compute_lift,
+    compute_drag,
+    compute_lift_and_drag,
+    compute_thrust_required,
+    compute_lift_vec,
+    compute_drag_vec,
+    compute_forces_batch,
+)
+from .parareal import run_trajectory_parareal
+from .simulation import (
+    SimulationState,
+    SimulationStateBatch,
+    TrajectoryBuffers,
+    AerodynamicsSimulator,
+    AerodynamicsSimulatorBatch,
+    run_trajectory,
+)
 
 __all__ = [
     "AircraftParams",
     "air_density",
+    "air_density_vec",
     "compute_lift",
     "compute_drag",
+    "compute_lift_and_drag",
     "compute_thrust_required",
+    "compute_lift_vec",
+    "compute_drag_vec",
+    "compute_forces_batch",
     "SimulationState",
+    "SimulationStateBatch",
+    "TrajectoryBuffers",
     "AerodynamicsSimulator",
+    "AerodynamicsSimulatorBatch",
+    "run_trajectory",
+    "run_trajectory_parareal",
 ]
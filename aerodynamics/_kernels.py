@@ -0,0 +1,233 @@
+"""
+Compiled inner kernels for the time-stepping simulation.
+
+These mirror air_density, lift_coefficient and drag_coefficient but take
+primitive floats only, so Numba can inline the whole force chain into one
+function. If Numba is not installed (or NUMBA_DISABLE_JIT is set) the same
+code runs as plain Python.
+"""
+
+import math
+from functools import lru_cache
+
+from . import settings
+from .atmosphere import _INV_T0, _RHO_11, _RHO_EXP, _STRAT_DECAY
+from .constants import GRAVITY, RHO_SEA_LEVEL, TEMP_SEA_LEVEL, LAPSE_RATE
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+if njit is None or settings.NUMBA_DISABLE_JIT:
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def air_density(altitude_m):
+    """Air density (kg/m³); see atmosphere.air_density."""
+    if altitude_m <= 0:
+        return RHO_SEA_LEVEL
+    if altitude_m > 11000:
+        return _RHO_11 * math.exp(_STRAT_DECAY * (altitude_m - 11000))
+    T = TEMP_SEA_LEVEL - LAPSE_RATE * altitude_m
+    return RHO_SEA_LEVEL * (T * _INV_T0) ** _RHO_EXP
+
+
+@njit(cache=True, fastmath=True)
+def lift_coefficient(angle_of_attack_rad, cl_alpha):
+    """Lift coefficient (linear, no stall)."""
+    return cl_alpha * angle_of_attack_rad
+
+
+@njit(cache=True, fastmath=True)
+def drag_coefficient(cl, cd0, aspect_ratio, oswald_efficiency):
+    """Total drag coefficient: parasitic + induced."""
+    if aspect_ratio <= 0 or oswald_efficiency <= 0:
+        return cd0
+    return cd0 + (cl * cl) / (math.pi * oswald_efficiency * aspect_ratio)
+
+
+# Explicit signatures compile the public kernels eagerly at import (or load
+# them from the on-disk cache) so the first step() pays no compile latency.
+_STEP_SIG = "UniTuple(f8, 5)(" + ", ".join(["f8"] * 11) + ")"
+_ADVANCE_SIG = "UniTuple(f8, 2)(" + ", ".join(["f8"] * 7) + ")"
+_SPECIALISED_SIG = "UniTuple(f8, 7)(f8, f8, f8, f8)"
+_TRAJECTORY_SIG = (
+    "void(" + ", ".join(["f8[::1]"] * 7 + ["f8"] * 12) + ")"
+)
+
+
+@njit(_STEP_SIG, cache=True, fastmath=True)
+def step_kernel(
+    altitude_m,
+    airspeed_m_s,
+    angle_of_attack_rad,
+    mass_kg,
+    wing_area_m2,
+    aspect_ratio,
+    oswald_efficiency,
+    cd0,
+    cl_alpha,
+    max_thrust_N,
+    thrust_ratio,
+):
+    """
+    Forces for one simulation step.
+
+    Returns (lift, drag, thrust, weight, axial_acceleration) in N and m/s².
+    """
+    rho = air_density(altitude_m)
+    cl = lift_coefficient(angle_of_attack_rad, cl_alpha)
+    cd = drag_coefficient(cl, cd0, aspect_ratio, oswald_efficiency)
+    qS = 0.5 * rho * airspeed_m_s * airspeed_m_s * wing_area_m2
+    L = qS * cl
+    D = qS * cd
+    # Clamps are written as conditional expressions, which LLVM lowers to
+    # minsd/maxsd selects rather than calls to the min/max builtins.
+    throttle = 1.0 if thrust_ratio > 1.0 else thrust_ratio
+    throttle = 0.0 if throttle < 0.0 else throttle
+    T = max_thrust_N * throttle
+    W = mass_kg * GRAVITY
+    axial = (T - D) / mass_kg
+    return L, D, T, W, axial
+
+
+@njit(_ADVANCE_SIG, cache=True, fastmath=True)
+def advance_state(altitude_m, airspeed_m_s, T, D, W, axial, dt_s):
+    """
+    Euler-integrate speed and altitude over one step.
+
+    Returns the new (altitude_m, airspeed_m_s).
+    """
+    airspeed_m_s = airspeed_m_s + axial * dt_s
+    airspeed_m_s = 5.0 if airspeed_m_s < 5.0 else airspeed_m_s
+    # Simple climb/descent: sin(gamma) ≈ (T - D) / W for small gamma.
+    # W <= 0 (no weight) keeps altitude; selected without a branch.
+    has_weight = W > 0
+    sin_gamma = (T - D) / (W if has_weight else 1.0)
+    sin_gamma = 0.5 if sin_gamma > 0.5 else sin_gamma
+    sin_gamma = -0.5 if sin_gamma < -0.5 else sin_gamma
+    # Only sin(gamma) is needed (gamma itself never is): dalt = v sin(gamma) dt
+    climbed = altitude_m + airspeed_m_s * sin_gamma * dt_s
+    climbed = 0.0 if climbed < 0.0 else climbed
+    altitude_m = climbed if has_weight else altitude_m
+    return altitude_m, airspeed_m_s
+
+
+@njit(_TRAJECTORY_SIG, cache=True, fastmath=True)
+def run_trajectory(
+    time_s,
+    altitude_out,
+    airspeed_out,
+    lift_N,
+    drag_N,
+    thrust_N,
+    acceleration_m_s2,
+    altitude_m,
+    airspeed_m_s,
+    angle_of_attack_rad,
+    mass_kg,
+    wing_area_m2,
+    aspect_ratio,
+    oswald_efficiency,
+    cd0,
+    cl_alpha,
+    max_thrust_N,
+    thrust_ratio,
+    dt_s,
+):
+    """
+    Run len(time_s) steps of the simulation entirely in compiled code.
+
+    The first seven arguments are preallocated 1-D output arrays, filled
+    in place with the state after each step (structure of arrays).
+    """
+    t = 0.0
+    for i in range(time_s.shape[0]):
+        L, D, T, W, axial = step_kernel(
+            altitude_m,
+            airspeed_m_s,
+            angle_of_attack_rad,
+            mass_kg,
+            wing_area_m2,
+            aspect_ratio,
+            oswald_efficiency,
+            cd0,
+            cl_alpha,
+            max_thrust_N,
+            thrust_ratio,
+        )
+        altitude_m, airspeed_m_s = advance_state(
+            altitude_m, airspeed_m_s, T, D, W, axial, dt_s
+        )
+        t += dt_s
+        time_s[i] = t
+        altitude_out[i] = altitude_m
+        airspeed_out[i] = airspeed_m_s
+        lift_N[i] = L
+        drag_N[i] = D
+        thrust_N[i] = T
+        acceleration_m_s2[i] = axial
+
+
+@lru_cache(maxsize=32)
+def make_step_kernel(
+    dt_s,
+    mass_kg,
+    wing_area_m2,
+    aspect_ratio,
+    oswald_efficiency,
+    cd0,
+    cl_alpha,
+    max_thrust_N,
+):
+    """
+    Build a step function specialised for a fixed configuration.
+
+    The arguments are captured as compile-time constants, so LLVM can fold
+    pi*e*AR, the weight and the 1/mass and ½S factors. The returned kernel
+    takes only the per-step inputs
+    (altitude_m, airspeed_m_s, angle_of_attack_rad, thrust_ratio) and
+    returns (altitude_m, airspeed_m_s, lift, drag, thrust, weight,
+    acceleration) after one step.
+
+    Each new configuration is compiled when built (~0.1 s the first time),
+    then cached in memory and in Numba's on-disk cache, so later processes
+    load it in a few milliseconds.
+    """
+    dt_s = float(dt_s)
+    mass_kg = float(mass_kg)
+    wing_area_m2 = float(wing_area_m2)
+    aspect_ratio = float(aspect_ratio)
+    oswald_efficiency = float(oswald_efficiency)
+    cd0 = float(cd0)
+    cl_alpha = float(cl_alpha)
+    max_thrust_N = float(max_thrust_N)
+
+    @njit(_SPECIALISED_SIG, cache=True, fastmath=True)
+    def kernel(altitude_m, airspeed_m_s, angle_of_attack_rad, thrust_ratio):
+        L, D, T, W, axial = step_kernel(
+            altitude_m,
+            airspeed_m_s,
+            angle_of_attack_rad,
+            mass_kg,
+            wing_area_m2,
+            aspect_ratio,
+            oswald_efficiency,
+            cd0,
+            cl_alpha,
+            max_thrust_N,
+            thrust_ratio,
+        )
+        altitude_m, airspeed_m_s = advance_state(
+            altitude_m, airspeed_m_s, T, D, W, axial, dt_s
+        )
+        return altitude_m, airspeed_m_s, L, D, T, W, axial
+
+    return kernel
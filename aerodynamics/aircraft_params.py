@@ -4,10 +4,10 @@ Configurable aircraft parameters for the aerodynamics model.
 Adjust these to simulate different aircraft or flight conditions.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
-@dataclass
+@dataclass(slots=True)
 class AircraftParams:
     """
     Aircraft and flight parameters. All can be changed to explore the model.
@@ -53,18 +53,4 @@ class AircraftParams:
 
     def copy_with(self, **kwargs) -> "AircraftParams":
         """Return a new instance with only the given fields updated."""
-        d = {
-            "mass_kg": self.mass_kg,
-            "wing_area_m2": self.wing_area_m2,
-            "aspect_ratio": self.aspect_ratio,
-            "cl_alpha": self.cl_alpha,
-            "cd0": self.cd0,
-            "oswald_efficiency": self.oswald_efficiency,
-            "max_thrust_N": self.max_thrust_N,
-            "thrust_ratio": self.thrust_ratio,
-            "altitude_m": self.altitude_m,
-            "airspeed_m_s": self.airspeed_m_s,
-            "angle_of_attack_deg": self.angle_of_attack_deg,
-        }
-        d.update(kwargs)
-        return AircraftParams(**d)
+        return replace(self, **kwargs)
@@ -2,6 +2,11 @@
 Standard atmosphere model: air density and pressure vs altitude.
 """
 
+import math
+from functools import lru_cache
+
+import numpy as np
+
 from .constants import (
     GRAVITY,
     RHO_SEA_LEVEL,
@@ -12,24 +17,54 @@ from .constants import (
 )
 
 
+# Altitude-independent terms, computed once at import rather than per call.
+_RHO_EXP = (GRAVITY * 0.0289644) / (GAS_CONSTANT * LAPSE_RATE) - 1
+_PRES_EXP = -GRAVITY / (GAS_CONSTANT * LAPSE_RATE)
+_INV_T0 = 1.0 / TEMP_SEA_LEVEL
+# Tropopause (11 km) temperature and density.
+_T_11 = TEMP_SEA_LEVEL - LAPSE_RATE * 11000
+_RHO_11 = RHO_SEA_LEVEL * (_T_11 * _INV_T0) ** _RHO_EXP
+# Stratosphere exponential decay rate (1/m), base e.
+_STRAT_DECAY = -0.000157
+
+
 def air_density(altitude_m: float) -> float:
     """
     Air density (kg/m³) at given altitude using ISA troposphere model.
     Valid for 0 <= altitude <= 11000 m.
+
+    Altitude is rounded to the nearest metre and results are cached, so
+    repeated calls at (nearly) constant altitude are a dict lookup. Density
+    changes by ~1e-4 relative per metre, well below the model's accuracy.
     """
+    if not math.isfinite(altitude_m):
+        # inf/nan cannot be rounded; evaluate directly (inf -> 0.0, nan -> nan)
+        return _air_density_uncached.__wrapped__(altitude_m)
+    return _air_density_uncached(round(altitude_m))
+
+
+@lru_cache(maxsize=1024)
+def _air_density_uncached(altitude_m: int) -> float:
+    """Uncached density for an integer altitude; see air_density."""
     if altitude_m <= 0:
         return RHO_SEA_LEVEL
     if altitude_m > 11000:
         # Simple extension: use stratosphere constant temp
-        T_11 = TEMP_SEA_LEVEL - LAPSE_RATE * 11000
-        rho_11 = RHO_SEA_LEVEL * (T_11 / TEMP_SEA_LEVEL) ** (
-            (GRAVITY * 0.0289644) / (GAS_CONSTANT * LAPSE_RATE) - 1
-        )
-        return rho_11 * (2.718 ** (-0.000157 * (altitude_m - 11000)))
+        return _RHO_11 * math.exp(_STRAT_DECAY * (altitude_m - 11000))
     T = TEMP_SEA_LEVEL - LAPSE_RATE * altitude_m
-    return RHO_SEA_LEVEL * (T / TEMP_SEA_LEVEL) ** (
-        (GRAVITY * 0.0289644) / (GAS_CONSTANT * LAPSE_RATE) - 1
-    )
+    return RHO_SEA_LEVEL * (T * _INV_T0) ** _RHO_EXP
+
+
+def air_density_vec(altitude_m):
+    """
+    Vectorized air_density: accepts a scalar or NumPy array of altitudes (m)
+    and returns densities (kg/m³) elementwise, with the same branches.
+    """
+    alt = np.asarray(altitude_m, dtype=float)
+    T = TEMP_SEA_LEVEL - LAPSE_RATE * np.clip(alt, 0.0, 11000.0)
+    rho_tropo = RHO_SEA_LEVEL * (T * _INV_T0) ** _RHO_EXP
+    rho_strato = _RHO_11 * np.exp(_STRAT_DECAY * np.maximum(alt - 11000, 0.0))
+    return np.where(alt > 11000, rho_strato, rho_tropo)
 
 
 def pressure(altitude_m: float) -> float:
@@ -37,6 +72,4 @@ def pressure(altitude_m: float) -> float:
     if altitude_m <= 0:
         return PRESSURE_SEA_LEVEL
     T = TEMP_SEA_LEVEL - LAPSE_RATE * min(altitude_m, 11000)
-    return PRESSURE_SEA_LEVEL * (T / TEMP_SEA_LEVEL) ** (
-        -GRAVITY / (GAS_CONSTANT * LAPSE_RATE)
-    )
+    return PRESSURE_SEA_LEVEL * (T * _INV_T0) ** _PRES_EXP
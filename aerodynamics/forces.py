@@ -9,8 +9,12 @@ Uses:
 """
 
 import math
+from dataclasses import fields
+
+import numpy as np
+
 from .aircraft_params import AircraftParams
-from .atmosphere import air_density
+from .atmosphere import air_density, air_density_vec
 from .constants import GRAVITY
 
 
@@ -34,25 +38,34 @@ def dynamic_pressure(rho: float, velocity: float) -> float:
     return 0.5 * rho * velocity * velocity
 
 
-def compute_lift(params: AircraftParams) -> float:
-    """Lift force (N) for current flight condition."""
-    rho = air_density(params.altitude_m)
-    alpha_rad = math.radians(params.angle_of_attack_deg)
-    cl = lift_coefficient(alpha_rad, params.cl_alpha)
-    q = dynamic_pressure(rho, params.airspeed_m_s)
-    return q * params.wing_area_m2 * cl
-
+def compute_lift_and_drag(params: AircraftParams) -> tuple[float, float]:
+    """
+    Lift and drag forces (N) for current flight condition.
+    Density, Cl and dynamic pressure are computed once and shared.
 
-def compute_drag(params: AircraftParams) -> float:
-    """Drag force (N) for current flight condition."""
+    Density comes from the cached air_density, which rounds altitude to the
+    nearest metre; compute_forces_batch and the simulators use the exact
+    altitude. Results can therefore differ by up to ~1e-4 relative off
+    whole-metre altitudes (e.g. 8819.37 vs 8819.43 N lift at 0.4 m).
+    """
     rho = air_density(params.altitude_m)
     alpha_rad = math.radians(params.angle_of_attack_deg)
     cl = lift_coefficient(alpha_rad, params.cl_alpha)
     cd = drag_coefficient(
         cl, params.cd0, params.aspect_ratio, params.oswald_efficiency
     )
-    q = dynamic_pressure(rho, params.airspeed_m_s)
-    return q * params.wing_area_m2 * cd
+    qS = dynamic_pressure(rho, params.airspeed_m_s) * params.wing_area_m2
+    return qS * cl, qS * cd
+
+
+def compute_lift(params: AircraftParams) -> float:
+    """Lift force (N) for current flight condition."""
+    return compute_lift_and_drag(params)[0]
+
+
+def compute_drag(params: AircraftParams) -> float:
+    """Drag force (N) for current flight condition."""
+    return compute_lift_and_drag(params)[1]
 
 
 def compute_thrust(params: AircraftParams) -> float:
@@ -71,3 +84,65 @@ def compute_thrust_required(params: AircraftParams) -> float:
     Does not depend on max_thrust or thrust_ratio.
     """
     return compute_drag(params)
+
+
+# Vectorized variants: accept scalars or NumPy arrays and compute elementwise,
+# so a parameter sweep runs as a handful of ufunc calls instead of a Python
+# loop over compute_lift / compute_drag.
+
+
+def compute_lift_vec(rho, v, S, cl_alpha, alpha_deg):
+    """Lift force (N), elementwise over array inputs."""
+    cl = cl_alpha * np.deg2rad(alpha_deg)
+    return 0.5 * rho * np.square(v) * S * cl
+
+
+def compute_drag_vec(
+    rho, v, S, cl_alpha, alpha_deg, cd0, aspect_ratio, oswald_efficiency
+):
+    """Drag force (N), elementwise over array inputs."""
+    cl = cl_alpha * np.deg2rad(alpha_deg)
+    aspect_ratio = np.asarray(aspect_ratio)
+    oswald_efficiency = np.asarray(oswald_efficiency)
+    # Same guard as drag_coefficient: either factor <= 0 means no induced drag
+    valid = (aspect_ratio > 0) & (oswald_efficiency > 0)
+    span_factor = np.pi * oswald_efficiency * aspect_ratio
+    induced = np.where(
+        valid, np.square(cl) / np.where(valid, span_factor, 1.0), 0.0
+    )
+    return 0.5 * rho * np.square(v) * S * (cd0 + induced)
+
+
+def compute_forces_batch(params_arrays) -> dict:
+    """
+    Forces for many flight conditions at once.
+
+    params_arrays maps AircraftParams field names to scalars or NumPy arrays
+    (broadcast together); missing fields take the AircraftParams defaults.
+    Returns a dict of arrays: rho, lift, drag, thrust, weight.
+    """
+    p = {f.name: f.default for f in fields(AircraftParams)}
+    unknown = set(params_arrays) - set(p)
+    if unknown:
+        raise KeyError(f"Unknown AircraftParams fields: {sorted(unknown)}")
+    p.update(params_arrays)
+
+    rho = air_density_vec(p["altitude_m"])
+    lift = compute_lift_vec(
+        rho, p["airspeed_m_s"], p["wing_area_m2"], p["cl_alpha"],
+        p["angle_of_attack_deg"],
+    )
+    drag = compute_drag_vec(
+        rho, p["airspeed_m_s"], p["wing_area_m2"], p["cl_alpha"],
+        p["angle_of_attack_deg"], p["cd0"], p["aspect_ratio"],
+        p["oswald_efficiency"],
+    )
+    thrust = np.asarray(p["max_thrust_N"]) * np.clip(p["thrust_ratio"], 0.0, 1.0)
+    weight = np.asarray(p["mass_kg"]) * GRAVITY
+    return {
+        "rho": rho,
+        "lift": lift,
+        "drag": drag,
+        "thrust": thrust,
+        "weight": weight,
+    }
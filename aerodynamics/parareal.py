@@ -0,0 +1,121 @@
+"""
+Parareal time-parallel propagation for long trajectories.
+
+The run is split into chunks. A cheap coarse propagator (large-dt Euler
+using the same step kernel) predicts the state at every chunk boundary;
+the fine propagator then runs each chunk concurrently from those
+predictions, and the Lions–Maday–Turinici correction
+
+    U[n+1] = G(U_new[n]) + F(U_old[n]) - G(U_old[n])
+
+refines the boundaries until they stop changing. After k iterations the
+first k chunks are exact, so at most n_chunks iterations are needed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .aircraft_params import AircraftParams
+from .simulation import TrajectoryBuffers, run_trajectory
+
+
+def _fine_chunk(
+    params: AircraftParams,
+    altitude_m: float,
+    airspeed_m_s: float,
+    dt_s: float,
+    n_steps: int,
+    t0_s: float,
+) -> TrajectoryBuffers:
+    """Fine propagator: full-resolution trajectory for one chunk."""
+    start = params.copy_with(altitude_m=altitude_m, airspeed_m_s=airspeed_m_s)
+    buffers = run_trajectory(start, dt_s, n_steps)
+    buffers.time_s += t0_s
+    return buffers
+
+
+def _coarse(
+    params: AircraftParams,
+    altitude_m: float,
+    airspeed_m_s: float,
+    duration_s: float,
+    dt_coarse: float,
+) -> tuple[float, float]:
+    """Coarse propagator: (altitude, airspeed) after duration_s."""
+    n = max(1, round(duration_s / dt_coarse))
+    start = params.copy_with(altitude_m=altitude_m, airspeed_m_s=airspeed_m_s)
+    buffers = run_trajectory(start, duration_s / n, n)
+    return float(buffers.altitude_m[-1]), float(buffers.airspeed_m_s[-1])
+
+
+def run_trajectory_parareal(
+    params: AircraftParams,
+    dt_fine: float,
+    dt_coarse: float,
+    n_steps: int,
+    n_chunks: int,
+    tol: float = 1e-6,
+    max_workers: int | None = None,
+) -> TrajectoryBuffers:
+    """
+    Same result as run_trajectory(params, dt_fine, n_steps), computed with
+    Parareal: n_chunks sub-intervals run in parallel worker processes.
+
+    Iterates until no chunk boundary state (altitude, airspeed) moves by
+    more than tol between iterations. Parareal does more total work than
+    the sequential loop, so it only wins with many free cores and a fine
+    step that is costly relative to process overhead.
+    """
+    if dt_coarse <= 0:
+        raise ValueError(f"dt_coarse must be positive, got {dt_coarse}")
+    if n_steps < 0:
+        raise ValueError(f"n_steps must be non-negative, got {n_steps}")
+    if n_steps == 0:
+        return TrajectoryBuffers.empty(0)
+    n_chunks = max(1, min(n_chunks, n_steps))
+    base, extra = divmod(n_steps, n_chunks)
+    sizes = [base + (i < extra) for i in range(n_chunks)]
+    t0 = np.concatenate(([0], np.cumsum(sizes)[:-1])) * dt_fine
+    durations = [size * dt_fine for size in sizes]
+
+    # Initial coarse sweep for the chunk boundary states.
+    U = [(float(params.altitude_m), float(params.airspeed_m_s))]
+    G_old = []
+    for i in range(n_chunks):
+        G_old.append(_coarse(params, *U[i], durations[i], dt_coarse))
+        U.append(G_old[i])
+
+    fine: list[TrajectoryBuffers | None] = [None] * n_chunks
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for k in range(n_chunks):
+            # Chunks before k already start from exact states.
+            futures = {
+                i: pool.submit(
+                    _fine_chunk, params, *U[i], dt_fine, sizes[i], t0[i]
+                )
+                for i in range(k, n_chunks)
+            }
+            for i, future in futures.items():
+                fine[i] = future.result()
+
+            U_new = U[: k + 1]
+            change = 0.0
+            for i in range(k, n_chunks):
+                g_new = _coarse(params, *U_new[i], durations[i], dt_coarse)
+                f_alt = fine[i].altitude_m[-1]
+                f_v = fine[i].airspeed_m_s[-1]
+                alt = max(0.0, g_new[0] + f_alt - G_old[i][0])
+                v = max(5.0, g_new[1] + f_v - G_old[i][1])
+                G_old[i] = g_new
+                change = max(
+                    change, abs(alt - U[i + 1][0]), abs(v - U[i + 1][1])
+                )
+                U_new.append((alt, v))
+            U = U_new
+            if change <= tol:
+                break
+
+    return TrajectoryBuffers(
+        *(np.concatenate(cols) for cols in zip(*(b.columns() for b in fine)))
+    )
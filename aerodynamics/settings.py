@@ -0,0 +1,7 @@
+"""Runtime settings for the aerodynamics package, read from the environment."""
+
+import os
+
+# Set NUMBA_DISABLE_JIT=1 to run the kernels as plain Python (debugging,
+# profiling, or environments without Numba). Numba honours the same variable.
+NUMBA_DISABLE_JIT = os.environ.get("NUMBA_DISABLE_JIT", "0") not in ("", "0")
@@ -6,20 +6,22 @@ You can change AircraftParams at any step to simulate parameter changes.
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 
+import numpy as np
+
+from . import _kernels
+from ._kernels import advance_state, make_step_kernel, step_kernel
 from .aircraft_params import AircraftParams
-from .atmosphere import air_density
-from .constants import GRAVITY
-from .forces import (
-    compute_lift,
-    compute_drag,
-    compute_thrust,
-    compute_weight,
-)
+from .forces import compute_forces_batch
+
+# A changed configuration must stay unchanged for this many steps before the
+# step kernel is re-specialised for it; until then the generic kernel runs.
+# Configurations that change every step therefore never trigger a compile.
+_RESPECIALISE_AFTER = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """Current state of the aircraft in the simulation."""
 
@@ -38,71 +40,293 @@ class SimulationState:
     acceleration_m_s2: float = 0.0
 
 
+@dataclass(slots=True)
+class TrajectoryBuffers:
+    """
+    Simulation history stored as one NumPy array per field (structure of
+    arrays). Row i of every array is the state after step i.
+    """
+
+    time_s: np.ndarray
+    altitude_m: np.ndarray
+    airspeed_m_s: np.ndarray
+    lift_N: np.ndarray
+    drag_N: np.ndarray
+    thrust_N: np.ndarray
+    acceleration_m_s2: np.ndarray
+
+    @classmethod
+    def empty(cls, n_steps: int) -> "TrajectoryBuffers":
+        """Allocate uninitialised buffers for n_steps steps."""
+        return cls(*(np.empty(n_steps) for _ in range(7)))
+
+    def columns(self) -> tuple[np.ndarray, ...]:
+        """All field arrays in declaration order."""
+        return (
+            self.time_s,
+            self.altitude_m,
+            self.airspeed_m_s,
+            self.lift_N,
+            self.drag_N,
+            self.thrust_N,
+            self.acceleration_m_s2,
+        )
+
+
 class AerodynamicsSimulator:
     """
     Simulates aircraft motion by integrating forces over time.
 
     Parameters can be changed between steps (e.g. throttle, angle of attack)
     to simulate pilot inputs or configuration changes.
+
+    A step kernel specialised on dt and the aircraft configuration (as
+    compile-time constants) is built when params is assigned. Each step
+    checks the current configuration against it; after a change (via
+    set_params, dt_s or mutating params directly) the generic kernel runs
+    until the new configuration has held for _RESPECIALISE_AFTER steps, and
+    the kernel is then re-specialised for it.
     """
 
     def __init__(self, params: AircraftParams, dt_s: float = 0.1):
-        self.params = params
         self.dt_s = dt_s
+        self.params = params
         self.state = SimulationState(
             altitude_m=params.altitude_m,
             airspeed_m_s=params.airspeed_m_s,
             angle_of_attack_deg=params.angle_of_attack_deg,
         )
+        self._alpha_deg = params.angle_of_attack_deg
+        self._alpha_rad = math.radians(self._alpha_deg)
 
-    def sync_params_from_state(self) -> None:
-        """Update params from current state (altitude, speed, alpha)."""
-        self.params.altitude_m = self.state.altitude_m
-        self.params.airspeed_m_s = self.state.airspeed_m_s
-        self.params.angle_of_attack_deg = self.state.angle_of_attack_deg
+    @property
+    def params(self) -> AircraftParams:
+        """Aircraft parameters; assigning a new object respecialises the kernel."""
+        return self._params
 
-    def step(self) -> SimulationState:
+    @params.setter
+    def params(self, value: AircraftParams) -> None:
+        self._params = value
+        self._rebuild_kernel()
+
+    def _config_key(self) -> tuple:
+        """
+        dt and the configuration fields baked into the specialised kernel,
+        in make_step_kernel argument order (key[1:] is also the configuration
+        slice of step_kernel's arguments).
+        """
+        p = self._params
+        return (
+            self.dt_s,
+            p.mass_kg,
+            p.wing_area_m2,
+            p.aspect_ratio,
+            p.oswald_efficiency,
+            p.cd0,
+            p.cl_alpha,
+            p.max_thrust_N,
+        )
+
+    def _rebuild_kernel(self) -> None:
+        """Specialise the step kernel for the current dt and configuration."""
+        self._kernel_key = self._config_key()
+        self._kernel = make_step_kernel(*self._kernel_key)
+        self._pending_key = None
+        self._pending_steps = 0
+
+    def _step_generic(self, key, alt, v, thrust_ratio):
+        """
+        One step with the generic kernel, for a configuration that differs
+        from the specialised one. Re-specialises once key has held for
+        _RESPECIALISE_AFTER steps.
+        """
+        if key == self._pending_key:
+            self._pending_steps += 1
+        else:
+            self._pending_key = key
+            self._pending_steps = 1
+        if self._pending_steps >= _RESPECIALISE_AFTER:
+            self._rebuild_kernel()
+        L, D, T, W, axial = step_kernel(
+            alt, v, self._alpha_rad, *key[1:], thrust_ratio
+        )
+        alt, v = advance_state(alt, v, T, D, W, axial, key[0])
+        return alt, v, L, D, T, W, axial
+
+    def get_state(self) -> SimulationState:
+        """Independent snapshot of the current state."""
+        return replace(self.state)
+
+    def step(self, record: bool = True) -> SimulationState:
         """
         Advance one time step using current params.
         Uses simplified longitudinal dynamics: thrust–drag along flight path,
         lift–weight perpendicular. Angle of attack is set by params (no pitch
         dynamics in this simplified model).
-        """
-        self.sync_params_from_state()
-        L = compute_lift(self.params)
-        D = compute_drag(self.params)
-        T = compute_thrust(self.params)
-        W = compute_weight(self.params)
 
-        alpha_rad = math.radians(self.params.angle_of_attack_deg)
+        With record=False only altitude, airspeed and time are updated; the
+        force and acceleration telemetry fields keep their previous values.
+        Use it in tight loops where only the final state matters.
+        """
+        p = self._params
         # Along flight path: T - D - W*sin(gamma). Assume small gamma ≈ 0.
         # So axial acceleration ≈ (T - D) / m (simplified).
-        axial = (T - D) / self.params.mass_kg
         # Perpendicular: L - W*cos(gamma) ≈ L - W. If L != W, we'd change
         # flight path; here we only update speed from axial.
-        self.state.lift_N = L
-        self.state.drag_N = D
-        self.state.thrust_N = T
-        self.state.weight_N = W
-        self.state.acceleration_m_s2 = axial
-
-        # Euler integration for speed
-        v = self.state.airspeed_m_s
-        self.state.airspeed_m_s = max(5.0, v + axial * self.dt_s)
-
-        # Simple climb/descent: sin(gamma) ≈ (T - D) / W for small gamma
-        if W > 0:
-            sin_gamma = max(-0.5, min(0.5, (T - D) / W))
-            climb_rate = self.state.airspeed_m_s * sin_gamma
-            self.state.altitude_m = max(
-                0.0, self.state.altitude_m + climb_rate * self.dt_s
+        alpha_deg = p.angle_of_attack_deg
+        if alpha_deg != self._alpha_deg:
+            # Convert once per change of alpha, not once per step
+            self._alpha_deg = alpha_deg
+            self._alpha_rad = math.radians(alpha_deg)
+        key = self._config_key()
+        state = self.state
+        if key == self._kernel_key:
+            alt, v, L, D, T, W, axial = self._kernel(
+                state.altitude_m, state.airspeed_m_s, self._alpha_rad,
+                p.thrust_ratio,
             )
-
-        self.state.time_s += self.dt_s
-        return self.state
+        else:
+            alt, v, L, D, T, W, axial = self._step_generic(
+                key, state.altitude_m, state.airspeed_m_s, p.thrust_ratio
+            )
+        state.angle_of_attack_deg = alpha_deg
+        state.altitude_m = alt
+        state.airspeed_m_s = v
+        state.time_s += key[0]
+        if record:
+            state.lift_N = L
+            state.drag_N = D
+            state.thrust_N = T
+            state.weight_N = W
+            state.acceleration_m_s2 = axial
+        return state
 
     def set_params(self, **kwargs) -> None:
         """Update simulation parameters (e.g. thrust_ratio, angle_of_attack_deg)."""
         for k, v in kwargs.items():
             if hasattr(self.params, k):
                 setattr(self.params, k, v)
+
+
+@dataclass(slots=True)
+class SimulationStateBatch:
+    """
+    State of N aircraft simulated together: one 1-D array per field
+    (structure of arrays). time_s is shared by the whole batch.
+    """
+
+    altitude_m: np.ndarray
+    airspeed_m_s: np.ndarray
+    angle_of_attack_deg: np.ndarray
+    time_s: float = 0.0
+
+    # Cached forces (N) from last step
+    lift_N: np.ndarray | None = None
+    drag_N: np.ndarray | None = None
+    thrust_N: np.ndarray | None = None
+    weight_N: np.ndarray | None = None
+
+    # Net acceleration (m/s²) from last step
+    acceleration_m_s2: np.ndarray | None = None
+
+
+class AerodynamicsSimulatorBatch:
+    """
+    Simulates N aircraft/configuration variations at once, each step being a
+    handful of NumPy ufunc calls over all N instead of N simulators.
+
+    params maps AircraftParams field names to scalars or arrays, broadcast
+    to a common 1-D shape (missing fields use the AircraftParams defaults),
+    e.g. {"altitude_m": np.linspace(0, 10000, 500), "thrust_ratio": 0.8}.
+    Dynamics match AerodynamicsSimulator.step().
+    """
+
+    def __init__(self, params: dict, dt_s: float = 0.1):
+        names = [f.name for f in fields(AircraftParams) if f.init]
+        unknown = set(params) - set(names)
+        if unknown:
+            raise KeyError(f"Unknown AircraftParams fields: {sorted(unknown)}")
+        defaults = AircraftParams()
+        values = [params.get(name, getattr(defaults, name)) for name in names]
+        self.params = {
+            name: np.array(arr, dtype=float)
+            for name, arr in zip(
+                names, np.broadcast_arrays(*map(np.atleast_1d, values))
+            )
+        }
+        self.dt_s = dt_s
+        self.state = SimulationStateBatch(
+            altitude_m=self.params["altitude_m"].copy(),
+            airspeed_m_s=self.params["airspeed_m_s"].copy(),
+            angle_of_attack_deg=self.params["angle_of_attack_deg"].copy(),
+        )
+
+    def __len__(self) -> int:
+        return self.state.altitude_m.size
+
+    def step(self) -> SimulationStateBatch:
+        """Advance every aircraft one time step; state arrays update in place."""
+        state = self.state
+        p = self.params
+        dt = self.dt_s
+        forces = compute_forces_batch(
+            {**p, "altitude_m": state.altitude_m,
+             "airspeed_m_s": state.airspeed_m_s}
+        )
+        L, D, T, W = (
+            forces["lift"], forces["drag"], forces["thrust"], forces["weight"]
+        )
+        axial = (T - D) / p["mass_kg"]
+
+        state.angle_of_attack_deg[:] = p["angle_of_attack_deg"]
+        state.lift_N = L
+        state.drag_N = D
+        state.thrust_N = T
+        state.weight_N = W
+        state.acceleration_m_s2 = axial
+
+        v = state.airspeed_m_s
+        np.maximum(5.0, v + axial * dt, out=v)
+        # Simple climb/descent: sin(gamma) ≈ (T - D) / W for small gamma
+        has_weight = W > 0
+        sin_gamma = np.clip((T - D) / np.where(has_weight, W, 1.0), -0.5, 0.5)
+        alt = state.altitude_m
+        climbed = np.maximum(0.0, alt + v * sin_gamma * dt)
+        np.copyto(alt, climbed, where=has_weight)
+
+        state.time_s += dt
+        return state
+
+    def set_params(self, **kwargs) -> None:
+        """Update parameters for the whole batch (scalars or length-N arrays)."""
+        for k, v in kwargs.items():
+            if k in self.params:
+                self.params[k][:] = v
+
+
+def run_trajectory(
+    params: AircraftParams, dt_s: float, n_steps: int
+) -> TrajectoryBuffers:
+    """
+    Run n_steps from the flight condition in params with the whole time loop
+    in compiled code. Equivalent to calling AerodynamicsSimulator.step()
+    n_steps times, but results are written straight into contiguous
+    per-field arrays instead of SimulationState objects.
+    """
+    buffers = TrajectoryBuffers.empty(n_steps)
+    _kernels.run_trajectory(
+        *buffers.columns(),
+        float(params.altitude_m),
+        float(params.airspeed_m_s),
+        math.radians(params.angle_of_attack_deg),
+        float(params.mass_kg),
+        float(params.wing_area_m2),
+        float(params.aspect_ratio),
+        float(params.oswald_efficiency),
+        float(params.cd0),
+        float(params.cl_alpha),
+        float(params.max_thrust_N),
+        float(params.thrust_ratio),
+        float(dt_s),
+    )
+    return buffers
@@ -7,19 +7,77 @@ Examples:
   python run_simulation.py --altitude 5000    # high altitude (thinner air)
   python run_simulation.py --alpha 5 --speed 60
   python run_simulation.py --throttle 0.7     # reduce thrust
+  python run_simulation.py --sweep altitude=0:10000:101   # steady-state sweep
 """
 
 import argparse
+import sys
+from dataclasses import asdict
+
+import numpy as np
 
 from aerodynamics import (
     AircraftParams,
-    AerodynamicsSimulator,
-    air_density,
-    compute_lift,
-    compute_drag,
-    compute_thrust_required,
+    compute_forces_batch,
+    run_trajectory,
 )
 
+# --sweep keys (CLI flag names) -> AircraftParams fields
+SWEEP_KEYS = {
+    "mass": "mass_kg",
+    "wing-area": "wing_area_m2",
+    "aspect-ratio": "aspect_ratio",
+    "cd0": "cd0",
+    "altitude": "altitude_m",
+    "speed": "airspeed_m_s",
+    "alpha": "angle_of_attack_deg",
+    "max-thrust": "max_thrust_N",
+    "throttle": "thrust_ratio",
+}
+
+
+def parse_sweep(text):
+    """Parse KEY=START:STOP:N into (field name, np.linspace array)."""
+    try:
+        key, spec = text.split("=", 1)
+        start, stop, n = spec.split(":")
+        values = np.linspace(float(start), float(stop), int(n))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected KEY=START:STOP:N, got {text!r}"
+        )
+    if key not in SWEEP_KEYS:
+        raise argparse.ArgumentTypeError(
+            f"unknown sweep key {key!r}; choose from {', '.join(SWEEP_KEYS)}"
+        )
+    return key, values
+
+
+def print_sweep(params, key, values):
+    """Steady-state forces over a parameter sweep, one NumPy pass per column."""
+    inputs = asdict(params)
+    inputs[SWEEP_KEYS[key]] = values
+    forces = compute_forces_batch(inputs)
+    # Fields not being swept come back as scalars; broadcast to the sweep
+    values, rho, lift, drag, weight, thrust = np.broadcast_arrays(
+        values, forces["rho"], forces["lift"], forces["drag"],
+        forces["weight"], forces["thrust"],
+    )
+    # Same sanity checks as the single-point summary, evaluated elementwise
+    lift_ok = np.abs(lift - weight) <= weight * 0.1
+    thrust_ok = np.abs(thrust - drag) <= drag * 0.1
+
+    print(f"=== Steady-state sweep over {key} ({values.size} points) ===\n")
+    print(f"  {key:>12} {'rho':>8} {'Lift(N)':>10} {'Drag(N)':>10} {'W(N)':>10} {'T(N)':>8} {'L≈W':>4} {'T≈D':>4}")
+    print("  " + "-" * 73)
+    np.savetxt(
+        sys.stdout,
+        np.column_stack(
+            (values, rho, lift, drag, weight, thrust, lift_ok, thrust_ok)
+        ),
+        fmt="  %12.2f %8.4f %10.1f %10.1f %10.1f %8.1f %4d %4d",
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -58,6 +116,13 @@ def main():
     parser.add_argument(
         "--dt", type=float, default=0.1, help="Time step (s)"
     )
+    parser.add_argument(
+        "--sweep",
+        type=parse_sweep,
+        metavar="KEY=START:STOP:N",
+        help="Steady-state sweep of one parameter instead of the default "
+        f"output. KEY is one of: {', '.join(SWEEP_KEYS)}",
+    )
     args = parser.parse_args()
 
     params = AircraftParams(
@@ -72,12 +137,17 @@ def main():
         thrust_ratio=args.throttle,
     )
 
+    if args.sweep is not None:
+        print_sweep(params, *args.sweep)
+        return
+
     # Steady-state summary (no time stepping)
-    rho = air_density(params.altitude_m)
-    lift = compute_lift(params)
-    drag = compute_drag(params)
-    weight = params.mass_kg * 9.81
-    thrust_req = compute_thrust_required(params)
+    forces = compute_forces_batch(asdict(params))
+    rho = float(forces["rho"])
+    lift = float(forces["lift"])
+    drag = float(forces["drag"])
+    weight = float(forces["weight"])
+    thrust_req = drag  # level flight: T = D
 
     print("=== Steady-state aerodynamics (current parameters) ===\n")
     print(f"  Altitude:        {params.altitude_m:.0f} m")
@@ -101,18 +171,18 @@ def main():
         print("  → Thrust ≠ Thrust required: speed will change over time.")
     print()
 
-    # Time stepping
-    sim = AerodynamicsSimulator(params, dt_s=args.dt)
+    # Time stepping (whole loop runs compiled; rows are only printed here)
+    trajectory = run_trajectory(params, args.dt, args.steps)
     print(f"=== Time evolution ({args.steps} steps × {args.dt} s) ===\n")
     print(f"  {'Time(s)':>8} {'Alt(m)':>8} {'Speed(m/s)':>10} {'Lift(N)':>10} {'Drag(N)':>10} {'T(N)':>8} {'a(m/s²)':>8}")
     print("  " + "-" * 64)
 
-    for _ in range(args.steps):
-        state = sim.step()
-        print(
-            f"  {state.time_s:8.1f} {state.altitude_m:8.1f} {state.airspeed_m_s:10.1f} "
-            f"{state.lift_N:10.1f} {state.drag_N:10.1f} {state.thrust_N:8.1f} {state.acceleration_m_s2:8.2f}"
-        )
+    # One bulk write, formatted in C, instead of a print() per step
+    np.savetxt(
+        sys.stdout,
+        np.column_stack(trajectory.columns()),
+        fmt="  %8.1f %8.1f %10.1f %10.1f %10.1f %8.1f %8.2f",
+    )
 
     print()
     print("Done. Change parameters via command-line flags to explore the model.")
@@ -0,0 +1,38 @@
+"""Vectorized force evaluation must agree with the scalar functions."""
+
+from dataclasses import asdict
+
+import numpy as np
+
+from aerodynamics import (
+    AircraftParams,
+    compute_drag,
+    compute_forces_batch,
+    compute_lift,
+)
+
+
+CASES = [
+    AircraftParams(),
+    AircraftParams(altitude_m=12000, airspeed_m_s=120),
+    AircraftParams(angle_of_attack_deg=-3.0, altitude_m=15000),
+    # Non-positive AR/e: both paths drop induced drag
+    AircraftParams(aspect_ratio=0.0),
+    AircraftParams(aspect_ratio=-8.0, oswald_efficiency=-0.8),
+    AircraftParams(oswald_efficiency=0.0),
+]
+
+
+def test_batch_matches_scalar():
+    # One batch mixing valid and invalid AR/e. Altitudes are whole metres
+    # because the scalar path quantises altitude to 1 m.
+    columns = {
+        name: np.array([asdict(p)[name] for p in CASES]) for name in asdict(CASES[0])
+    }
+    forces = compute_forces_batch(columns)
+    np.testing.assert_allclose(
+        forces["lift"], [compute_lift(p) for p in CASES], rtol=1e-13
+    )
+    np.testing.assert_allclose(
+        forces["drag"], [compute_drag(p) for p in CASES], rtol=1e-13
+    )
@@ -0,0 +1,39 @@
+"""Parareal propagation must reproduce the sequential trajectory."""
+
+import numpy as np
+import pytest
+
+from aerodynamics import AircraftParams, run_trajectory, run_trajectory_parareal
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        AircraftParams(),
+        AircraftParams(thrust_ratio=0.0),
+        AircraftParams(altitude_m=12000, airspeed_m_s=120),
+    ],
+)
+@pytest.mark.parametrize("n_steps, n_chunks", [(2000, 4), (2003, 4), (1001, 7)])
+def test_matches_sequential(params, n_steps, n_chunks):
+    # 2003/4 and 1001/7 exercise uneven divmod chunk sizes
+    expected = run_trajectory(params, 0.01, n_steps)
+    result = run_trajectory_parareal(
+        params, 0.01, 0.5, n_steps, n_chunks, tol=1e-9, max_workers=2
+    )
+    for got, want in zip(result.columns(), expected.columns()):
+        assert got.shape == (n_steps,)
+        np.testing.assert_allclose(got, want, rtol=0, atol=1e-6)
+
+
+def test_zero_steps():
+    result = run_trajectory_parareal(AircraftParams(), 0.01, 0.5, 0, 4)
+    assert all(col.shape == (0,) for col in result.columns())
+
+
+@pytest.mark.parametrize(
+    "dt_coarse, n_steps", [(0.0, 100), (-0.5, 100), (0.5, -1)]
+)
+def test_invalid_arguments(dt_coarse, n_steps):
+    with pytest.raises(ValueError):
+        run_trajectory_parareal(AircraftParams(), 0.01, dt_coarse, n_steps, 4)
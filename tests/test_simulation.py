@@ -0,0 +1,77 @@
+"""AerodynamicsSimulator must honour every way of changing its inputs."""
+
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from aerodynamics import (
+    AerodynamicsSimulator,
+    AerodynamicsSimulatorBatch,
+    AircraftParams,
+)
+from aerodynamics.simulation import _RESPECIALISE_AFTER
+
+
+def _run(sim, n_steps, record=True):
+    for _ in range(n_steps):
+        sim.step(record=record)
+    return asdict(sim.get_state())
+
+
+def test_direct_params_mutation_matches_fresh_simulator():
+    sim = AerodynamicsSimulator(AircraftParams(), dt_s=0.1)
+    sim.params.mass_kg = 60000  # the specialised kernel captured 70000
+    fresh = AerodynamicsSimulator(AircraftParams(mass_kg=60000), dt_s=0.1)
+    # Long enough to cross re-specialisation on the mutated simulator
+    n_steps = 2 * _RESPECIALISE_AFTER
+    assert _run(sim, n_steps) == pytest.approx(_run(fresh, n_steps), rel=1e-12)
+
+
+def test_dt_change_is_respecialised():
+    sim = AerodynamicsSimulator(AircraftParams(), dt_s=0.1)
+    sim.dt_s = 0.05
+    _run(sim, _RESPECIALISE_AFTER + 1)
+    assert sim._kernel_key[0] == 0.05
+
+
+def test_state_assignment_takes_effect():
+    sim = AerodynamicsSimulator(AircraftParams(), dt_s=0.1)
+    sim.state.altitude_m = 8000.0
+    sim.state.airspeed_m_s = 200.0
+    state = sim.step()
+
+    fresh = AerodynamicsSimulator(
+        AircraftParams(altitude_m=8000.0, airspeed_m_s=200.0), dt_s=0.1
+    )
+    assert asdict(state) == pytest.approx(asdict(fresh.step()), rel=1e-12)
+
+
+def test_record_false_final_state_matches_recorded():
+    recorded = AerodynamicsSimulator(AircraftParams(), dt_s=0.1)
+    fast = AerodynamicsSimulator(AircraftParams(), dt_s=0.1)
+    want = _run(recorded, 500)
+    got = _run(fast, 500, record=False)
+    for name in ("time_s", "altitude_m", "airspeed_m_s", "angle_of_attack_deg"):
+        assert got[name] == want[name]
+
+
+def test_batch_matches_scalar():
+    altitudes = [0.0, 3000.0, 12000.0]
+    sims = [
+        AerodynamicsSimulator(AircraftParams(altitude_m=alt), dt_s=0.1)
+        for alt in altitudes
+    ]
+    batch = AerodynamicsSimulatorBatch(
+        {"altitude_m": np.array(altitudes)}, dt_s=0.1
+    )
+    names = ("altitude_m", "airspeed_m_s", "lift_N", "drag_N", "thrust_N",
+             "weight_N", "acceleration_m_s2")
+    for _ in range(200):
+        got = batch.step()
+        want = [sim.step() for sim in sims]
+        for name in names:
+            np.testing.assert_allclose(
+                getattr(got, name), [getattr(w, name) for w in want],
+                rtol=1e-13, atol=0, err_msg=name,
+            )